@@ -1,37 +1,172 @@
 import argparse
+import functools
+import importlib.util
 import logging
 import os
 import platform
 import sys
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Optional, Text
 
-from rasa_sdk import __version__ as rasa_sdk_version
-
-from rasa import version
-from rasa.cli import (
-    data,
-    export,
-    interactive,
-    run,
-    scaffold,
-    shell,
-    telemetry,
-    test,
-    train,
-    visualize,
-    x,
-)
+from rasa.cli import SubParsersAction
 from rasa.cli.arguments.default_arguments import add_logging_options
 from rasa.cli.utils import parse_last_positional_argument_as_model_path
 from rasa.shared.exceptions import RasaException
 from rasa.shared.utils.cli import print_error
-import rasa.telemetry
 from rasa.utils.common import set_log_and_warnings_filters, set_log_level
-import rasa.utils.io
-import rasa.utils.tensorflow.environment as tf_env
 
 logger = logging.getLogger(__name__)
 
 
+def _lazy_import(module_name: Text) -> ModuleType:
+    """Imports a module lazily.
+
+    The module is bound right away, but only executed on first attribute access.
+
+    Args:
+        module_name: Fully qualified name of the module.
+
+    Returns:
+        The (not yet executed) module.
+    """
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+
+    spec = importlib.util.find_spec(module_name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    loader.exec_module(module)
+
+    # bind the module to its package like a regular import would do
+    package_name, _, name = module_name.rpartition(".")
+    setattr(sys.modules[package_name], name, module)
+
+    return module
+
+
+# Modules implementing the `rasa` commands together with the help text shown for
+# them in `rasa --help`. Keeping the help text here allows listing all commands
+# without importing their modules (and with them TensorFlow, sklearn, etc.).
+# The modules are loaded lazily, i.e. they are only executed once the parser of
+# the invoked command is built.
+_SUBCOMMANDS = {
+    "init": (
+        _lazy_import("rasa.cli.scaffold"),
+        "Creates a new project, with example training data, actions, and config "
+        "files.",
+    ),
+    "run": (
+        _lazy_import("rasa.cli.run"),
+        "Starts a Rasa server with your trained model.",
+    ),
+    "shell": (
+        _lazy_import("rasa.cli.shell"),
+        "Loads your trained model and lets you talk to your assistant on the "
+        "command line.",
+    ),
+    "train": (
+        _lazy_import("rasa.cli.train"),
+        "Trains a Rasa model using your NLU data and stories.",
+    ),
+    "interactive": (
+        _lazy_import("rasa.cli.interactive"),
+        "Starts an interactive learning session to create new training data for a "
+        "Rasa model by chatting.",
+    ),
+    "telemetry": (
+        _lazy_import("rasa.cli.telemetry"),
+        "Configuration of Rasa Open Source telemetry reporting.",
+    ),
+    "test": (
+        _lazy_import("rasa.cli.test"),
+        "Tests Rasa models using your test NLU data and stories.",
+    ),
+    "visualize": (_lazy_import("rasa.cli.visualize"), "Visualize stories."),
+    "data": (_lazy_import("rasa.cli.data"), "Utils for the Rasa training files."),
+    "export": (
+        _lazy_import("rasa.cli.export"),
+        "Export conversations using an event broker.",
+    ),
+    "x": (_lazy_import("rasa.cli.x"), "Starts the Rasa X interface."),
+}
+
+
+class _LazySubParsersAction(SubParsersAction):
+    """Subparsers action which only builds the parser of a command once it's used.
+
+    Commands are registered with a placeholder parser which lists them in the help.
+    The placeholder is replaced by the actual parser of the command when argparse
+    dispatches to it, so only the invoked command pays for building its parser.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._parser_builders: Dict[Text, Callable[[SubParsersAction], None]] = {}
+
+    def add_lazy_parser(
+        self,
+        name: Text,
+        builder: Callable[[SubParsersAction], None],
+        help: Optional[Text] = None,
+    ) -> None:
+        """Registers a command whose parser is built once the command is invoked.
+
+        Args:
+            name: Name of the command.
+            builder: Function which adds the parser of the command to the
+                subparsers action it is called with.
+            help: Help text of the command. If `None` the command is hidden in the
+                help.
+        """
+        if help:
+            self.add_parser(name, help=help)
+        else:
+            self.add_parser(name)
+
+        self._parser_builders[name] = builder
+
+    def _build_parser(self, name: Text) -> None:
+        builder = self._parser_builders.pop(name, None)
+        if builder is None:
+            return
+
+        # let the command add its parser to a separate action and swap it in for
+        # the placeholder
+        actions = SubParsersAction(
+            option_strings=[], prog=self._prog_prefix, parser_class=self._parser_class
+        )
+        builder(actions)
+        self._name_parser_map[name] = actions._name_parser_map[name]
+
+    def __call__(
+        self,
+        parser: argparse.ArgumentParser,
+        namespace: argparse.Namespace,
+        values: List[Text],
+        option_string: Optional[Text] = None,
+    ) -> None:
+        self._build_parser(values[0])
+        super().__call__(parser, namespace, values, option_string)
+
+
+def _add_command_subparser(
+    module: ModuleType,
+    subparsers: SubParsersAction,
+    parents: List[argparse.ArgumentParser],
+) -> None:
+    module.add_subparser(subparsers, parents=parents)
+
+
+def _subcommand_help(name: Text) -> Optional[Text]:
+    if name == "x" and importlib.util.find_spec("rasax") is None:
+        # we'll only show the help msg for the command if Rasa X is actually installed
+        return None
+
+    return _SUBCOMMANDS[name][1]
+
+
 def create_argument_parser() -> argparse.ArgumentParser:
     """Parse all the command line arguments for the training script."""
 
@@ -55,19 +190,16 @@ def create_argument_parser() -> argparse.ArgumentParser:
     add_logging_options(parent_parser)
     parent_parsers = [parent_parser]
 
-    subparsers = parser.add_subparsers(help="Rasa commands")
+    subparsers = parser.add_subparsers(
+        help="Rasa commands", action=_LazySubParsersAction
+    )
 
-    scaffold.add_subparser(subparsers, parents=parent_parsers)
-    run.add_subparser(subparsers, parents=parent_parsers)
-    shell.add_subparser(subparsers, parents=parent_parsers)
-    train.add_subparser(subparsers, parents=parent_parsers)
-    interactive.add_subparser(subparsers, parents=parent_parsers)
-    telemetry.add_subparser(subparsers, parents=parent_parsers)
-    test.add_subparser(subparsers, parents=parent_parsers)
-    visualize.add_subparser(subparsers, parents=parent_parsers)
-    data.add_subparser(subparsers, parents=parent_parsers)
-    export.add_subparser(subparsers, parents=parent_parsers)
-    x.add_subparser(subparsers, parents=parent_parsers)
+    for name, (module, _) in _SUBCOMMANDS.items():
+        subparsers.add_lazy_parser(
+            name,
+            functools.partial(_add_command_subparser, module, parents=parent_parsers),
+            help=_subcommand_help(name),
+        )
 
     return parser
 
@@ -75,6 +207,9 @@ def create_argument_parser() -> argparse.ArgumentParser:
 def print_version() -> None:
     """Prints version information of rasa tooling and python."""
 
+    from rasa import version
+    from rasa_sdk import __version__ as rasa_sdk_version
+
     python_version, os_info = sys.version.split("\n")
     try:
         from rasax.community.version import __version__
@@ -103,13 +238,18 @@ def main() -> None:
     )
     set_log_level(log_level)
 
-    tf_env.setup_tf_environment()
-
     # insert current path in syspath so custom modules are found
     sys.path.insert(1, os.getcwd())
 
     try:
         if hasattr(cmdline_arguments, "func"):
+            # only needed when actually running a command, keep them out of the
+            # `--help` / `--version` code paths
+            import rasa.telemetry
+            import rasa.utils.io
+            import rasa.utils.tensorflow.environment as tf_env
+
+            tf_env.setup_tf_environment()
             rasa.utils.io.configure_colored_logging(log_level)
             set_log_and_warnings_filters()
             rasa.telemetry.initialize_error_reporting()
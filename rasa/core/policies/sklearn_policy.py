@@ -1,9 +1,10 @@
 import json
 import logging
+import pickle
 import typing
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Text, Tuple, Union
-from collections import defaultdict, OrderedDict
+from collections import defaultdict
 import scipy.sparse
 
 import numpy as np
@@ -21,18 +22,11 @@ from rasa.core.policies.policy import Policy
 from rasa.shared.core.trackers import DialogueStateTracker
 from rasa.shared.core.generator import TrackerWithCachedStates
 import rasa.shared.utils.io
-from sklearn.base import clone
-from sklearn.linear_model import LogisticRegression
-from sklearn.model_selection import GridSearchCV
-from sklearn.preprocessing import LabelEncoder
 from rasa.shared.nlu.constants import ACTION_TEXT, TEXT
 from rasa.shared.nlu.training_data.features import Features
 from rasa.utils.tensorflow.constants import SENTENCE
 from rasa.utils.tensorflow.model_data import Data
 
-# noinspection PyProtectedMember
-from sklearn.utils import shuffle as sklearn_shuffle
-
 logger = logging.getLogger(__name__)
 
 if typing.TYPE_CHECKING:
@@ -62,7 +56,7 @@ class SklearnPolicy(Policy):
         param_grid: Optional[Dict[Text, List] or List[Dict]] = None,
         cv: Optional[int] = None,
         scoring: Optional[Text or List or Dict or Callable] = "accuracy",
-        label_encoder: LabelEncoder = LabelEncoder(),
+        label_encoder: Optional["sklearn.preprocessing.LabelEncoder"] = None,
         shuffle: bool = True,
         zero_state_features: Optional[Dict[Text, List["Features"]]] = None,
         **kwargs: Any,
@@ -85,6 +79,7 @@ class SklearnPolicy(Policy):
             shuffle: Whether to shuffle training data.
             zero_state_features: Contains default feature values for attributes
         """
+        from sklearn.preprocessing import LabelEncoder
 
         if featurizer:
             if not isinstance(featurizer, MaxHistoryTrackerFeaturizer):
@@ -110,13 +105,19 @@ class SklearnPolicy(Policy):
         self.cv = cv
         self.param_grid = param_grid
         self.scoring = scoring
-        self.label_encoder = label_encoder
+        if label_encoder is not None:
+            self.label_encoder = label_encoder
+        else:
+            self.label_encoder = LabelEncoder()
         self.shuffle = shuffle
 
         # attributes that need to be restored after loading
         self._pickle_params = ["model", "cv", "param_grid", "scoring", "label_encoder"]
         self._train_params = kwargs
         self.zero_state_features = zero_state_features or defaultdict(list)
+        # action indices of the classes predicted by the model, the label encoder
+        # doesn't change after training so they are only computed once
+        self._class_indices = None
 
         rasa.shared.utils.io.raise_deprecation_warning(
             f"'{SklearnPolicy.__name__}' is deprecated and will be removed in "
@@ -125,6 +126,8 @@ class SklearnPolicy(Policy):
 
     @staticmethod
     def _default_model() -> Any:
+        from sklearn.linear_model import LogisticRegression
+
         return LogisticRegression(solver="liblinear", multi_class="auto")
 
     @property
@@ -138,47 +141,40 @@ class SklearnPolicy(Policy):
 
     @staticmethod
     def _fill_in_features_to_max_length(
-        features: List[np.ndarray], max_history: int
-    ) -> List[np.ndarray]:
+        features: List[Union[np.ndarray, scipy.sparse.coo_matrix]],
+        max_history: int,
+        padded_features: np.ndarray,
+    ) -> None:
         """
         Pad features with zeros to maximum length;
         Args:
-            features: list of features for each dialog;
+            features: list of (dense or sparse) features for each dialog;
                 each feature has shape [dialog_history x shape_attribute]
             max_history: maximum history of the dialogs
-        Returns:
-            padded features
+            padded_features: zero initialized array of shape
+                [num_dialogs x (max_history * shape_attribute)] the flattened
+                features are written to
         """
         feature_shape = features[0].shape[-1]
-        features = [
-            feature
-            if feature.shape[0] == max_history
-            else np.vstack(
-                [np.zeros((max_history - feature.shape[0], feature_shape)), feature]
-            )
-            for feature in features
-        ]
-        return features
-
-    def _get_features_for_attribute(self, attribute_data: Dict[Text, List[np.ndarray]]):
-        """
-        Given a list of all features for one attribute, turn it into a numpy array;
-        shape_attribute = features[SENTENCE][0][0].shape[-1]
-            (Shape of features of one attribute)
-        Args:
-            attribute_data: all features in the attribute stored in a np.array;
-        Output:
-            2D np.ndarray with features for an attribute with
-                shape [num_dialogs x (max_history * shape_attribute)]
-        """
-        sentence_features = attribute_data[SENTENCE][0]
-        if isinstance(sentence_features[0], scipy.sparse.coo_matrix):
-            sentence_features = [feature.toarray() for feature in sentence_features]
-        # MaxHistoryFeaturizer is always used with SkLearn policy;
-        max_history = self.featurizer.max_history
-        features = self._fill_in_features_to_max_length(sentence_features, max_history)
-        features = [feature.reshape((1, -1)) for feature in features]
-        return np.vstack(features)
+        if isinstance(features, np.ndarray) and features.ndim == 3:
+            # all dialogs have the same length, so the features are already
+            # stacked and can be padded with a single assignment
+            offset = (max_history - features.shape[1]) * feature_shape
+            padded_features[:, offset:] = features.reshape((len(features), -1))
+            return
+
+        for index, feature in enumerate(features):
+            offset = (max_history - feature.shape[0]) * feature_shape
+            if isinstance(feature, scipy.sparse.coo_matrix):
+                # add the non zero entries directly instead of converting the
+                # features of every dialog to a dense array first
+                np.add.at(
+                    padded_features[index],
+                    offset + feature.row * feature_shape + feature.col,
+                    feature.data,
+                )
+            else:
+                padded_features[index, offset:] = feature.reshape(-1)
 
     def _preprocess_data(self, data: Data) -> np.ndarray:
         """
@@ -197,17 +193,37 @@ class SklearnPolicy(Policy):
                 f"Try to use TEDPolicy instead. "
             )
 
-        attribute_data = {
-            attribute: self._get_features_for_attribute(attribute_data)
-            for attribute, attribute_data in data.items()
-        }
-        # turning it into OrderedDict so that the order of features is the same
-        attribute_data = OrderedDict(attribute_data)
-        return np.concatenate(list(attribute_data.values()), axis=-1)
+        # MaxHistoryFeaturizer is always used with SkLearn policy;
+        max_history = self.featurizer.max_history
+        sentence_features = [
+            attribute_data[SENTENCE][0] for attribute_data in data.values()
+        ]
+        feature_sizes = [
+            max_history * features[0].shape[-1] for features in sentence_features
+        ]
+
+        # fill the features of all attributes into a single preallocated array
+        # instead of concatenating separately created arrays
+        training_data = np.zeros((len(sentence_features[0]), sum(feature_sizes)))
+        start = 0
+        for features, size in zip(sentence_features, feature_sizes):
+            self._fill_in_features_to_max_length(
+                features, max_history, training_data[:, start : start + size]
+            )
+            start += size
+
+        return training_data
 
     def _search_and_score(self, model, X, y, param_grid) -> Tuple[Any, Any]:
+        from sklearn.model_selection import GridSearchCV
+
         search = GridSearchCV(
-            model, param_grid=param_grid, cv=self.cv, scoring="accuracy", verbose=1
+            model,
+            param_grid=param_grid,
+            cv=self.cv,
+            scoring=self.scoring,
+            verbose=1,
+            n_jobs=-1,
         )
         search.fit(X, y)
         print("Best params:", search.best_params_)
@@ -220,6 +236,8 @@ class SklearnPolicy(Policy):
         interpreter: NaturalLanguageInterpreter,
         **kwargs: Any,
     ) -> None:
+        from sklearn.base import clone
+
         tracker_state_features, label_ids = self.featurize_for_training(
             training_trackers, domain, interpreter, **kwargs
         )
@@ -233,11 +251,13 @@ class SklearnPolicy(Policy):
         score = None
         # Note: clone is called throughout to avoid mutating default arguments.
         self.label_encoder = clone(self.label_encoder).fit(label_ids)
+        self._class_indices = None
         X = self._preprocess_data(training_data)
         y = self.label_encoder.transform(label_ids)
 
         if self.shuffle:
-            X, y = sklearn_shuffle(X, y)
+            permutation = np.random.permutation(len(X))
+            X, y = X[permutation], y[permutation]
 
         if self.cv is None:
             model = clone(model).fit(X, y)
@@ -251,17 +271,19 @@ class SklearnPolicy(Policy):
             logger.info(f"Cross validation score: {score:.5f}")
 
     def _postprocess_prediction(self, y_proba, domain) -> List[float]:
-        yp = y_proba[0].tolist()
+        yp = y_proba[0]
 
         # Some classes might not be part of the training labels. Since
         # sklearn does not predict labels it has never encountered
         # during training, it is necessary to insert missing classes.
-        indices = self.label_encoder.inverse_transform(np.arange(len(yp)))
-        y_filled = [0.0 for _ in range(domain.num_actions)]
-        for i, pred in zip(indices, yp):
-            y_filled[i] = pred
+        if self._class_indices is None:
+            self._class_indices = self.label_encoder.inverse_transform(
+                np.arange(len(yp))
+            )
+        y_filled = np.zeros(domain.num_actions)
+        y_filled[self._class_indices] = yp
 
-        return y_filled
+        return y_filled.tolist()
 
     def predict_action_probabilities(
         self,
@@ -279,6 +301,7 @@ class SklearnPolicy(Policy):
         return self._postprocess_prediction(y_proba, domain)
 
     def persist(self, path: Union[Text, Path]) -> None:
+        import joblib
 
         if self.model:
             self.featurizer.persist(path)
@@ -290,7 +313,10 @@ class SklearnPolicy(Policy):
             rasa.shared.utils.io.dump_obj_as_json_to_file(meta_file, meta)
 
             filename = path / "sklearn_model.pkl"
-            rasa.utils.io.pickle_dump(filename, self._state)
+            # joblib stores the numpy arrays of the model efficiently
+            joblib.dump(
+                self._state, filename, compress=3, protocol=pickle.HIGHEST_PROTOCOL
+            )
 
             zero_features_filename = path / "zero_state_features.pkl"
             io_utils.pickle_dump(zero_features_filename, self.zero_state_features)
@@ -303,6 +329,8 @@ class SklearnPolicy(Policy):
 
     @classmethod
     def load(cls, path: Union[Text, Path]) -> Policy:
+        import joblib
+
         filename = Path(path) / "sklearn_model.pkl"
         zero_features_filename = Path(path) / "zero_state_features.pkl"
         if not Path(path).exists():
@@ -327,7 +355,7 @@ class SklearnPolicy(Policy):
             zero_state_features=zero_state_features,
         )
 
-        state = io_utils.pickle_load(filename)
+        state = joblib.load(filename)
 
         vars(policy).update(state)
 
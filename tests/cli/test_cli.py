@@ -45,3 +45,20 @@ def test_version_print_lines(run: Callable[..., RunResult]):
     assert "Python Version" in output_text
     assert "Operating System" in output_text
     assert "Python Path" in output_text
+
+
+def test_create_argument_parser_lists_all_commands():
+    from rasa.__main__ import create_argument_parser
+
+    help_text = create_argument_parser().format_help()
+
+    assert "train" in help_text
+    assert "Trains a Rasa model using your NLU data and stories." in help_text
+
+
+def test_create_argument_parser_builds_invoked_command():
+    from rasa.__main__ import create_argument_parser
+
+    cmdline_arguments = create_argument_parser().parse_args(["train", "core"])
+
+    assert cmdline_arguments.func.__name__ == "train_core"
@@ -175,7 +175,7 @@ class TestSklearnPolicy(PolicyTestCollection):
 
     @pytest.yield_fixture
     def mock_search(self):
-        with patch("rasa.core.policies.sklearn_policy.GridSearchCV") as gs:
+        with patch("sklearn.model_selection.GridSearchCV") as gs:
             gs.best_estimator_ = "mockmodel"
             gs.best_score_ = 0.123
             gs.return_value = gs  # for __init__
@@ -222,13 +222,18 @@ class TestSklearnPolicy(PolicyTestCollection):
     ):
         param_grid = {"n_estimators": 50}
         policy = self.create_policy(
-            featurizer=featurizer, priority=priority, cv=3, param_grid=param_grid
+            featurizer=featurizer,
+            priority=priority,
+            cv=3,
+            param_grid=param_grid,
+            scoring="f1_macro",
         )
         policy.train(trackers, domain=default_domain, interpreter=RegexInterpreter())
 
         assert mock_search.call_count > 0
         assert mock_search.call_args_list[0][1]["cv"] == 3
         assert mock_search.call_args_list[0][1]["param_grid"] == param_grid
+        assert mock_search.call_args_list[0][1]["scoring"] == "f1_macro"
         assert policy.model == "mockmodel"
 
     def test_missing_classes_filled_correctly(